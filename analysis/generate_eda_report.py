@@ -1,39 +1,136 @@
+"""Incrementally regenerate the EDA report and summary.
+
+Aggregate state is persisted next to the summary (``eda_state.json``). Each run
+reads only the CSV rows appended since the previous run and folds them into the
+stored counts. CompStat windows of every partition end at the dataset's latest
+date, so all partitions are rewritten when that date moves; otherwise only the
+partitions that received new rows are. Edits to already-processed rows trigger a
+full rebuild.
+
+    python analysis/generate_eda_report.py                        # overall report
+    python analysis/generate_eda_report.py --group-by Beats -j 4  # one report per beat
+"""
+
 from __future__ import annotations
 
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+import hashlib
 import json
 from pathlib import Path
+import re
+import shutil
 import sys
+from typing import Dict, Iterable, List, Optional, Tuple
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
-from backend.app.analytics import build_time_series, compute_compstat
-from backend.app.data_loader import CrimeDataRepository
+from backend.app.aggregations import AggregateState
+from backend.app.config import settings
+from backend.app.data_loader import CsvWatermark, read_csv_increment
 
+STATE_VERSION = 3
+REPORT_TITLE = "# Arlington East District Crime - Exploratory Analysis"
+OVERALL = "All"
+REPORT_FILES = {"eda_report.md", "eda_summary.json"}
 
-def main() -> None:
-    repo = CrimeDataRepository()
-    df = repo.load(force=True)
-    latest_date = df["occurred_ts"].max()
-
-    compstat_overall = compute_compstat(df)
-    compstat_category = compute_compstat(df, group_by="crime_category")
-    hour_distribution = (
-        df.groupby("hour_of_day").size().reset_index(name="count").sort_values("hour_of_day")
-    )
-    day_distribution = (
-        df.groupby("day_of_week").size().reset_index(name="count").sort_values("count", ascending=False)
-    )
-    beats_distribution = (
-        df.groupby("Beats").size().reset_index(name="count").sort_values("count", ascending=False)
-    )
-    recent_series = build_time_series(df, freq="D", periods=60).to_dict(orient="records")
 
-    report_path = PROJECT_ROOT / "analysis" / "eda_report.md"
-    summary_path = PROJECT_ROOT / "analysis" / "eda_summary.json"
+def _slug(value: object) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", str(value)).strip("_") or "unknown"
+
+
+def _partition_dirs(output_dir: Path, group_by: Optional[str], labels: Iterable[str]) -> Dict[str, Path]:
+    """Map partition labels to output directories, disambiguating labels that slug alike."""
+    labels = sorted(labels)
+    if group_by is None:
+        return {label: output_dir for label in labels}
+    slugs = {label: _slug(label) for label in labels}
+    taken: Dict[str, int] = {}
+    for slug in slugs.values():
+        taken[slug] = taken.get(slug, 0) + 1
+    root = output_dir / _slug(group_by)
+    return {
+        label: root
+        / (slug if taken[slug] == 1 else f"{slug}-{hashlib.sha1(label.encode()).hexdigest()[:8]}")
+        for label, slug in slugs.items()
+    }
+
+
+def _remove_stale_dirs(output_dir: Path, group_by: Optional[str], keep: Iterable[Path]) -> None:
+    """Delete report directories of partitions that are no longer in the state."""
+    root = output_dir / _slug(group_by) if group_by is not None else None
+    if root is None or not root.is_dir():
+        return
+    keep = set(keep)
+    for child in root.iterdir():
+        if (
+            child.is_dir()
+            and child not in keep
+            and {entry.name for entry in child.iterdir()} <= REPORT_FILES
+        ):
+            shutil.rmtree(child)
+
+
+def _state_path(output_dir: Path, group_by: Optional[str]) -> Path:
+    if group_by is None:
+        return output_dir / "eda_state.json"
+    return output_dir / _slug(group_by) / "eda_state.json"
+
+
+def _load_state(
+    path: Path, csv_path: str, group_by: Optional[str]
+) -> Tuple[Optional[CsvWatermark], Optional[date], Dict[str, AggregateState]]:
+    if not path.exists():
+        return None, None, {}
+    payload = json.loads(path.read_text())
+    if (
+        payload.get("version") != STATE_VERSION
+        or payload.get("source") != csv_path
+        or payload.get("group_by") != group_by
+    ):
+        return None, None, {}
+    watermark = CsvWatermark.from_dict(payload["watermark"])
+    as_of_date = date.fromisoformat(payload["as_of_date"]) if payload.get("as_of_date") else None
+    partitions = {
+        label: AggregateState.from_dict(state) for label, state in payload["partitions"].items()
+    }
+    return watermark, as_of_date, partitions
+
+
+def _save_state(
+    path: Path,
+    csv_path: str,
+    group_by: Optional[str],
+    watermark: CsvWatermark,
+    as_of_date: Optional[date],
+    partitions: Dict[str, AggregateState],
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": STATE_VERSION,
+        "source": csv_path,
+        "group_by": group_by,
+        "watermark": watermark.as_dict(),
+        "as_of_date": as_of_date.isoformat() if as_of_date is not None else None,
+        "partitions": {label: state.as_dict() for label, state in partitions.items()},
+    }
+    path.write_text(json.dumps(payload, indent=2))
+
 
-    top_categories = df.groupby("crime_category").size().sort_values(ascending=False).head(10)
+def render_report(
+    state: AggregateState, title: str = REPORT_TITLE, as_of_date: Optional[date] = None
+) -> str:
+    compstat_overall = state.compstat(as_of_date=as_of_date)
+    hour_distribution = state.count_frame("hour_of_day").sort_values("hour_of_day")
+    top_categories = (
+        state.count_frame("crime_category")
+        .set_index("crime_category")["count"]
+        .sort_values(ascending=False)
+        .head(10)
+    )
     peak_hour = (
         hour_distribution.loc[hour_distribution["count"].idxmax(), "hour_of_day"]
         if not hour_distribution.empty
@@ -41,11 +138,11 @@ def main() -> None:
     )
 
     report_lines = [
-        "# Arlington East District Crime - Exploratory Analysis",
+        title,
         "",
-        f"- Total incidents: **{len(df):,}**",
-        f"- Coverage: **{df['occurred_date'].min()} - {df['occurred_date'].max()}**",
-        f"- Latest record timestamp: **{latest_date}**",
+        f"- Total incidents: **{state.records:,}**",
+        f"- Coverage: **{min(state.daily_totals)} - {max(state.daily_totals)}**",
+        f"- Latest record timestamp: **{state.latest_ts}**",
         "",
         "## CompStat Windows (overall)",
     ]
@@ -77,19 +174,122 @@ def main() -> None:
         report_lines.append(
             f"- Hour-of-day intensity peaks at {int(peak_hour):02d}:00 with elevated evening activity."
         )
+    return "\n".join(report_lines)
 
-    report_path.write_text("\n".join(report_lines))
 
-    summary_payload = {
-        "compstat_overall": compstat_overall,
-        "compstat_by_category": compstat_category,
-        "hour_distribution": hour_distribution.to_dict(orient="records"),
-        "day_distribution": day_distribution.to_dict(orient="records"),
-        "beats_distribution": beats_distribution.to_dict(orient="records"),
-        "recent_daily_counts": recent_series,
+def build_summary(state: AggregateState, as_of_date: Optional[date] = None) -> Dict[str, object]:
+    top_categories = (
+        state.count_frame("crime_category")
+        .set_index("crime_category")["count"]
+        .sort_values(ascending=False)
+        .head(10)
+    )
+    return {
+        "compstat_overall": state.compstat(as_of_date=as_of_date),
+        "compstat_by_category": state.compstat(by_category=True, as_of_date=as_of_date),
+        "hour_distribution": state.count_frame("hour_of_day")
+        .sort_values("hour_of_day")
+        .to_dict(orient="records"),
+        "day_distribution": state.count_frame("day_of_week")
+        .sort_values("count", ascending=False)
+        .to_dict(orient="records"),
+        "beats_distribution": state.count_frame("Beats")
+        .sort_values("count", ascending=False)
+        .to_dict(orient="records"),
+        "recent_daily_counts": state.daily_series(periods=60).to_dict(orient="records"),
         "top_categories": top_categories.to_dict(),
     }
-    summary_path.write_text(json.dumps(summary_payload, indent=2, default=str))
+
+
+def _write_partition(task: Tuple[Path, str, AggregateState, Optional[date]]) -> Path:
+    target_dir, title, state, as_of_date = task
+    target_dir.mkdir(parents=True, exist_ok=True)
+    (target_dir / "eda_report.md").write_text(render_report(state, title=title, as_of_date=as_of_date))
+    (target_dir / "eda_summary.json").write_text(
+        json.dumps(build_summary(state, as_of_date=as_of_date), indent=2, default=str)
+    )
+    return target_dir
+
+
+def generate(
+    csv_path: str = str(settings.DATA_FILE),
+    output_dir: Path = PROJECT_ROOT / "analysis",
+    group_by: Optional[str] = None,
+    workers: int = 1,
+    full: bool = False,
+) -> List[Path]:
+    """Fold new CSV rows into the saved state and rewrite the affected reports."""
+    state_path = _state_path(output_dir, group_by)
+    watermark, previous_as_of, partitions = (
+        (None, None, {}) if full else _load_state(state_path, csv_path, group_by)
+    )
+
+    new_rows, watermark, rebuilt = read_csv_increment(csv_path, watermark)
+    if rebuilt:
+        partitions = {}
+
+    touched: List[str] = []
+    if not new_rows.empty:
+        if group_by is None:
+            increments = [(OVERALL, new_rows)]
+        else:
+            if group_by not in new_rows.columns:
+                raise KeyError(f"Column '{group_by}' not found in dataset")
+            increments = [(str(name), frame) for name, frame in new_rows.groupby(group_by)]
+        for label, frame in increments:
+            partitions.setdefault(label, AggregateState()).merge(AggregateState.from_frame(frame))
+            touched.append(label)
+
+    # CompStat windows are date-relative, not additive: once the as-of date moves
+    # every partition's windows shift, whether or not it received new rows.
+    latest = [state.latest_ts for state in partitions.values() if state.latest_ts is not None]
+    as_of_date = max(latest).date() if latest else None
+    dirs = _partition_dirs(output_dir, group_by, partitions)
+    for label in sorted(partitions):
+        if label not in touched and (
+            as_of_date != previous_as_of or not (dirs[label] / "eda_summary.json").exists()
+        ):
+            touched.append(label)
+
+    tasks = [
+        (
+            dirs[label],
+            REPORT_TITLE if group_by is None else f"{REPORT_TITLE} ({group_by}: {label})",
+            partitions[label],
+            as_of_date,
+        )
+        for label in touched
+    ]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            written = list(executor.map(_write_partition, tasks))
+    else:
+        written = [_write_partition(task) for task in tasks]
+
+    _remove_stale_dirs(output_dir, group_by, dirs.values())
+    _save_state(state_path, csv_path, group_by, watermark, as_of_date, partitions)
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default=str(settings.DATA_FILE), help="Source CSV path.")
+    parser.add_argument(
+        "--output-dir", type=Path, default=PROJECT_ROOT / "analysis", help="Where reports and state are written."
+    )
+    parser.add_argument("--group-by", default=None, help="Generate one report per value of this column.")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="Parallel report writers.")
+    parser.add_argument("--full", action="store_true", help="Ignore saved state and rebuild from scratch.")
+    args = parser.parse_args()
+
+    written = generate(
+        csv_path=args.csv,
+        output_dir=args.output_dir,
+        group_by=args.group_by,
+        workers=args.workers,
+        full=args.full,
+    )
+    print(f"Updated {len(written)} report(s).")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
 from pandas.api.types import CategoricalDtype
 
+from .analytics import compstat_from_daily_counts, daily_counts
+
 DAY_ORDER = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+EDA_DIMENSIONS = ("hour_of_day", "day_of_week", "Beats", "crime_category")
 
 
 def _validate_column(df: pd.DataFrame, column: str) -> None:
@@ -48,3 +54,119 @@ def heatmap(df: pd.DataFrame, dim_x: str, dim_y: str) -> pd.DataFrame:
 
     grouped = grouped.sort_values([dim_y, dim_x]).reset_index(drop=True)
     return grouped
+
+
+def _native(value: Any) -> Any:
+    return value.item() if hasattr(value, "item") else value
+
+
+@dataclass
+class AggregateState:
+    """Additive incident counts that back the EDA endpoints and report.
+
+    Built in a single pass over a frame and merged with the state of newly
+    appended rows, so consumers never have to regroup the full dataset.
+    """
+
+    records: int = 0
+    latest_ts: Optional[pd.Timestamp] = None
+    dimension_counts: Dict[str, Counter] = field(default_factory=dict)
+    daily_totals: Counter = field(default_factory=Counter)
+    daily_by_category: Dict[str, Counter] = field(default_factory=dict)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, dimensions: Iterable[str] = EDA_DIMENSIONS) -> "AggregateState":
+        state = cls(records=int(len(df)))
+        if df.empty:
+            return state
+        state.latest_ts = df["occurred_ts"].max()
+        for dimension in dimensions:
+            if dimension in df.columns:
+                grouped = df.groupby(dimension).size()
+                state.dimension_counts[dimension] = Counter(
+                    {_native(key): int(count) for key, count in grouped.items()}
+                )
+        state.daily_totals = Counter(daily_counts(df)["All"])
+        state.daily_by_category = {
+            name: Counter(counts) for name, counts in daily_counts(df, group_by="crime_category").items()
+        }
+        return state
+
+    def merge(self, other: "AggregateState") -> "AggregateState":
+        self.records += other.records
+        if other.latest_ts is not None and (self.latest_ts is None or other.latest_ts > self.latest_ts):
+            self.latest_ts = other.latest_ts
+        for dimension, counts in other.dimension_counts.items():
+            self.dimension_counts.setdefault(dimension, Counter()).update(counts)
+        self.daily_totals.update(other.daily_totals)
+        for name, counts in other.daily_by_category.items():
+            self.daily_by_category.setdefault(name, Counter()).update(counts)
+        return self
+
+    def count_frame(self, dimension: str) -> pd.DataFrame:
+        """Return ``[dimension, count]`` rows in the same order as ``df.groupby(dimension).size()``."""
+        if dimension not in self.dimension_counts:
+            raise KeyError(f"Column '{dimension}' not found in aggregate state")
+        items = sorted(self.dimension_counts[dimension].items())
+        return pd.DataFrame(items, columns=[dimension, "count"])
+
+    def compstat(
+        self, by_category: bool = False, as_of_date: Optional[date] = None
+    ) -> Dict[str, List[Dict[str, Optional[float]]]]:
+        """CompStat windows ending at ``as_of_date`` (defaults to this state's latest record)."""
+        if as_of_date is None:
+            if self.latest_ts is None:
+                return {}
+            as_of_date = self.latest_ts.date()
+        counts = (
+            {name: self.daily_by_category[name] for name in sorted(self.daily_by_category)}
+            if by_category
+            else {"All": self.daily_totals}
+        )
+        return compstat_from_daily_counts(counts, as_of_date)
+
+    def daily_series(self, periods: Optional[int] = None) -> pd.DataFrame:
+        """Zero-filled daily counts, matching ``build_time_series(df, freq="D")``."""
+        if not self.daily_totals:
+            return pd.DataFrame(columns=["period", "count"])
+        index = pd.date_range(min(self.daily_totals), max(self.daily_totals), freq="D")
+        series = pd.Series(
+            [self.daily_totals.get(day.date(), 0) for day in index], index=index, name="count"
+        )
+        if periods:
+            series = series.iloc[-periods:]
+        return pd.DataFrame({"period": series.index.strftime("%Y-%m-%d"), "count": series.values})
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "records": self.records,
+            "latest_ts": self.latest_ts.isoformat() if self.latest_ts is not None else None,
+            "dimension_counts": {
+                dimension: [[key, count] for key, count in sorted(counts.items())]
+                for dimension, counts in self.dimension_counts.items()
+            },
+            "daily_totals": {day.isoformat(): count for day, count in sorted(self.daily_totals.items())},
+            "daily_by_category": {
+                name: {day.isoformat(): count for day, count in sorted(counts.items())}
+                for name, counts in self.daily_by_category.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "AggregateState":
+        latest_ts = payload.get("latest_ts")
+        return cls(
+            records=int(payload.get("records", 0)),
+            latest_ts=pd.Timestamp(latest_ts) if latest_ts else None,
+            dimension_counts={
+                dimension: Counter({key: int(count) for key, count in pairs})
+                for dimension, pairs in payload.get("dimension_counts", {}).items()
+            },
+            daily_totals=Counter(
+                {date.fromisoformat(day): int(count) for day, count in payload.get("daily_totals", {}).items()}
+            ),
+            daily_by_category={
+                name: Counter({date.fromisoformat(day): int(count) for day, count in counts.items()})
+                for name, counts in payload.get("daily_by_category", {}).items()
+            },
+        )
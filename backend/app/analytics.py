@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import asdict, dataclass
 from datetime import date, datetime, timedelta
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Mapping, Optional
 
 import pandas as pd
 
@@ -38,63 +38,69 @@ class WindowComparison:
         return payload
 
 
-def _filter_by_range(
-    df: pd.DataFrame,
-    start_date: date,
-    end_date: date,
-) -> pd.DataFrame:
-    """Return rows between start/end dates (inclusive) using precomputed occurred_date."""
+def daily_counts(df: pd.DataFrame, group_by: Optional[str] = None) -> Dict[str, Dict[date, int]]:
+    """Count incidents per occurred_date, keyed by group label ("All" when ungrouped)."""
     if "occurred_date" not in df.columns:
         df = df.assign(occurred_date=df["occurred_ts"].dt.date)
-    mask = (df["occurred_date"] >= start_date) & (df["occurred_date"] <= end_date)
-    return df.loc[mask]
+    if group_by and group_by in df.columns:
+        grouped = df.groupby([group_by, "occurred_date"]).size()
+        results: Dict[str, Dict[date, int]] = {}
+        for (name, day), count in grouped.items():
+            results.setdefault(str(name), {})[day] = int(count)
+        return results
+    return {"All": {day: int(count) for day, count in df.groupby("occurred_date").size().items()}}
 
 
-def compute_compstat(
-    df: pd.DataFrame,
+def _sum_range(counts: Mapping[date, int], start_date: date, end_date: date) -> int:
+    return sum(count for day, count in counts.items() if start_date <= day <= end_date)
+
+
+def compstat_from_daily_counts(
+    counts_by_group: Mapping[str, Mapping[date, int]],
+    as_of_date: date,
     windows: Iterable[int] = WINDOWS,
-    as_of: Optional[datetime] = None,
-    group_by: Optional[str] = None,
 ) -> Dict[str, List[Dict[str, Optional[float]]]]:
-    if as_of is None:
-        as_of = df["occurred_ts"].max()
-    df = df[df["occurred_ts"] <= as_of]
-    as_of_date = as_of.date()
+    """Build CompStat window comparisons from pre-aggregated daily counts."""
     results: Dict[str, List[Dict[str, Optional[float]]]] = {}
-    groups = [("All", df)]
-    if group_by and group_by in df.columns:
-        groups = [(str(name), group) for name, group in df.groupby(group_by)]
-
-    for group_name, group_df in groups:
+    for group_name, counts in counts_by_group.items():
         group_results: List[Dict[str, Optional[float]]] = []
         for window in windows:
             window_days = max(window, 1)
             end_date = as_of_date
             start_date = as_of_date - timedelta(days=window_days - 1)
-            current_df = _filter_by_range(group_df, start_date, end_date)
 
             previous_end = start_date - timedelta(days=1)
             previous_start = previous_end - timedelta(days=window_days - 1)
-            previous_df = _filter_by_range(group_df, previous_start, previous_end)
 
             yoy_start = start_date - timedelta(days=365)
             yoy_end = end_date - timedelta(days=365)
-            yoy_df = _filter_by_range(group_df, yoy_start, yoy_end)
 
             result = WindowComparison(
                 label=group_name,
                 window_days=window_days,
                 start_date=start_date,
                 end_date=end_date,
-                current_count=int(current_df.shape[0]),
-                previous_period_count=int(previous_df.shape[0]),
-                yoy_count=int(yoy_df.shape[0]),
+                current_count=_sum_range(counts, start_date, end_date),
+                previous_period_count=_sum_range(counts, previous_start, previous_end),
+                yoy_count=_sum_range(counts, yoy_start, yoy_end),
             )
             group_results.append(result.as_dict())
         results[group_name] = group_results
     return results
 
 
+def compute_compstat(
+    df: pd.DataFrame,
+    windows: Iterable[int] = WINDOWS,
+    as_of: Optional[datetime] = None,
+    group_by: Optional[str] = None,
+) -> Dict[str, List[Dict[str, Optional[float]]]]:
+    if as_of is None:
+        as_of = df["occurred_ts"].max()
+    df = df[df["occurred_ts"] <= as_of]
+    return compstat_from_daily_counts(daily_counts(df, group_by=group_by), as_of.date(), windows)
+
+
 def build_time_series(
     df: pd.DataFrame,
     freq: str = "D",
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from datetime import timedelta
 from pathlib import Path
 
@@ -11,6 +12,11 @@ class Settings:
     DATA_DIR = PROJECT_ROOT / "data"
     DATA_FILE = DATA_DIR / "East District Arlingtontx odp crime - PROD.csv"
     CACHE_TTL = timedelta(minutes=15)
+    # "lazy": warm the data snapshot in the background and import the ML stack on first /ml/* call.
+    # "eager": load data and the ML stack before the app starts serving.
+    STARTUP_MODES = ("lazy", "eager")
+    # Validated by the API's lifespan, so offline scripts importing settings are unaffected.
+    STARTUP_MODE = os.getenv("STARTUP_MODE", "lazy").strip().lower()
 
 
 settings = Settings()
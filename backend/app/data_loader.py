@@ -1,8 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import io
+import os
+import threading
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import pandas as pd
 
@@ -34,6 +38,85 @@ def _preprocess(df: pd.DataFrame) -> pd.DataFrame:
     return processed
 
 
+@dataclass(frozen=True)
+class CsvWatermark:
+    """Byte position (and digest of everything before it) already consumed from a CSV.
+
+    ``dtypes`` records the column types pandas inferred for the consumed rows so
+    appended rows can be parsed consistently with them.
+    """
+
+    offset: int
+    mtime: float
+    sha256: str
+    dtypes: Dict[str, str] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, object]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, object]) -> "CsvWatermark":
+        return cls(
+            offset=int(payload["offset"]),
+            mtime=float(payload["mtime"]),
+            sha256=str(payload["sha256"]),
+            dtypes={str(column): str(dtype) for column, dtype in dict(payload.get("dtypes", {})).items()},
+        )
+
+
+def read_csv_increment(
+    csv_path: str,
+    watermark: Optional[CsvWatermark] = None,
+) -> Tuple[pd.DataFrame, CsvWatermark, bool]:
+    """Read rows appended to ``csv_path`` since ``watermark``.
+
+    Returns the preprocessed new rows, the updated watermark and whether the whole
+    file had to be re-read. Any change to previously consumed bytes (edits, deletes,
+    truncation) falls back to a full read so callers can rebuild their state. So do
+    appended rows that cannot be parsed with the consumed rows' column types (for
+    example a blank or non-numeric value in an integer column), since a full parse
+    would infer different types for the whole column.
+    """
+    stat = os.stat(csv_path)
+    if watermark is not None and stat.st_size == watermark.offset and stat.st_mtime == watermark.mtime:
+        return pd.DataFrame(), watermark, False
+
+    with open(csv_path, "rb") as handle:
+        raw = handle.read()
+    def _full_read() -> Tuple[pd.DataFrame, CsvWatermark, bool]:
+        df = pd.read_csv(io.BytesIO(raw))
+        dtypes = {str(column): str(dtype) for column, dtype in df.dtypes.items()}
+        return _preprocess(df), replace(new_watermark, dtypes=dtypes), True
+
+    new_watermark = CsvWatermark(
+        offset=len(raw),
+        mtime=stat.st_mtime,
+        sha256=hashlib.sha256(raw).hexdigest(),
+        dtypes=watermark.dtypes if watermark is not None else {},
+    )
+
+    appendable = (
+        watermark is not None
+        and 0 < watermark.offset <= len(raw)
+        and hashlib.sha256(raw[: watermark.offset]).hexdigest() == watermark.sha256
+        and (watermark.offset == len(raw) or raw[watermark.offset - 1 : watermark.offset] == b"\n")
+    )
+    if not appendable or not watermark.dtypes:
+        return _full_read()
+
+    tail = raw[watermark.offset :]
+    if not tail.strip():
+        return pd.DataFrame(), new_watermark, False
+    header = raw[: raw.index(b"\n") + 1]
+    try:
+        appended = pd.read_csv(io.BytesIO(header + tail), dtype=watermark.dtypes)
+    except (TypeError, ValueError):
+        return _full_read()
+    if list(appended.columns) != list(watermark.dtypes):
+        return _full_read()
+    return _preprocess(appended), new_watermark, False
+
+
 @dataclass
 class CrimeDataRepository:
     csv_path: str = str(settings.DATA_FILE)
@@ -42,22 +125,29 @@ class CrimeDataRepository:
     def __post_init__(self) -> None:
         self._cache: Optional[pd.DataFrame] = None
         self._cache_timestamp: Optional[datetime] = None
+        # Serialises parsing so requests arriving during startup warm-up wait for one load.
+        self._lock = threading.Lock()
 
     def load(self, force: bool = False) -> pd.DataFrame:
-        now = datetime.utcnow()
-        if (
-            not force
-            and self._cache is not None
-            and self._cache_timestamp is not None
-            and (now - self._cache_timestamp).total_seconds() < self.cache_ttl_seconds
-        ):
-            return self._cache
-
-        df = pd.read_csv(self.csv_path)
-        df = _preprocess(df)
-        self._cache = df
-        self._cache_timestamp = now
-        return df
+        with self._lock:
+            now = datetime.utcnow()
+            if (
+                not force
+                and self._cache is not None
+                and self._cache_timestamp is not None
+                and (now - self._cache_timestamp).total_seconds() < self.cache_ttl_seconds
+            ):
+                return self._cache
+
+            df = pd.read_csv(self.csv_path)
+            df = _preprocess(df)
+            self._cache = df
+            self._cache_timestamp = now
+            return df
+
+    def snapshot(self) -> Optional[pd.DataFrame]:
+        """Return the cached frame (even if past its TTL) without loading, or None."""
+        return self._cache
 
     def refresh(self) -> pd.DataFrame:
         return self.load(force=True)
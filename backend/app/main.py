@@ -1,19 +1,82 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, Optional, TypeVar, cast
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+import threading
+from types import ModuleType
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, Optional, TypeVar, cast
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 
-from .aggregations import count_by as agg_count_by, heatmap as agg_heatmap
+from .aggregations import AggregateState, count_by as agg_count_by, heatmap as agg_heatmap
 from .analytics import build_time_series, compute_compstat
+from .config import settings
 from .data_loader import CrimeDataRepository
-from .modeling import RandomForestForecast, SarimaxForecast, train_random_forest, train_sarimax
+
+if TYPE_CHECKING:
+    from .modeling import RandomForestForecast, SarimaxForecast
+
+logger = logging.getLogger(__name__)
+
+repository = CrimeDataRepository()
+
+# Startup phases reported by /health. data: pending -> warming -> ready | failed;
+# ml: deferred -> loading -> ready | failed.
+_readiness: Dict[str, Optional[str]] = {"data": "pending", "ml": "deferred", "error": None}
+_ml_lock = threading.Lock()
+_aggregate_lock = threading.Lock()
+
+
+def _warm_snapshot() -> None:
+    _readiness["data"] = "warming"
+    try:
+        _aggregate_state()
+    except Exception as exc:  # surfaced through /health; requests retry the load themselves
+        logger.exception("Data warm-up failed")
+        _readiness["data"] = "failed"
+        _readiness["error"] = str(exc)
+
+
+def _modeling() -> ModuleType:
+    """Import the scikit-learn/statsmodels stack on first use."""
+    with _ml_lock:
+        if _readiness["ml"] != "ready":
+            _readiness["ml"] = "loading"
+        try:
+            from . import modeling
+        except Exception:
+            _readiness["ml"] = "failed"
+            raise
+        _readiness["ml"] = "ready"
+        return modeling
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    if settings.STARTUP_MODE not in settings.STARTUP_MODES:
+        raise ValueError(
+            f"STARTUP_MODE must be one of {', '.join(settings.STARTUP_MODES)}; got '{settings.STARTUP_MODE}'"
+        )
+    if settings.STARTUP_MODE == "eager":
+        await asyncio.to_thread(_warm_snapshot)
+        await asyncio.to_thread(_modeling)
+        yield
+        return
+
+    _readiness["data"] = "warming"
+    warmup = asyncio.create_task(asyncio.to_thread(_warm_snapshot))
+    yield
+    if not warmup.done():
+        warmup.cancel()
+
 
 app = FastAPI(
     title="Arlington Crime CompStat API",
     version="1.0.0",
     description="High-frequency analytics and forecasting for Arlington East District open data.",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -24,14 +87,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-repository = CrimeDataRepository()
-
 _model_cache: Dict[str, Dict[str, Optional[object]]] = {
     "random_forest": {"latest_ts": None, "result": None},
     "sarimax": {"latest_ts": None, "result": None},
 }
 
-TForecast = TypeVar("TForecast", RandomForestForecast, SarimaxForecast)
+# Keyed on the loaded frame itself: back-filled or edited rows can leave the max timestamp unchanged.
+_aggregate_cache: Dict[str, Optional[object]] = {"frame": None, "result": None}
+
+TForecast = TypeVar("TForecast", "RandomForestForecast", "SarimaxForecast")
 
 
 def _train_if_stale(model_key: str, trainer: Callable[[object], TForecast]) -> TForecast:
@@ -44,13 +108,38 @@ def _train_if_stale(model_key: str, trainer: Callable[[object], TForecast]) -> T
     return cast(TForecast, cache["result"])
 
 
-@app.get("/health")
-def healthcheck() -> Dict[str, str]:
+def _aggregate_state() -> AggregateState:
     df = repository.load()
+    # Read and build under the lock so warm-up and concurrent requests build the state once
+    # and never observe a half-updated cache.
+    with _aggregate_lock:
+        state = _aggregate_cache["result"]
+        if state is None or _aggregate_cache["frame"] is not df:
+            state = AggregateState.from_frame(df)
+            _aggregate_cache["result"] = state
+            _aggregate_cache["frame"] = df
+    # Any successful build (warm-up or a request retrying after a failed warm-up) means data is ready.
+    _readiness["data"] = "ready"
+    _readiness["error"] = None
+    return cast(AggregateState, state)
+
+
+@app.get("/health")
+def healthcheck() -> Dict[str, object]:
+    phases = {"data": _readiness["data"], "ml": _readiness["ml"]}
+    # Report whatever snapshot is loaded; a request thread may have loaded it before the warm-up flag flips.
+    df = repository.snapshot()
+    if df is None:
+        if _readiness["data"] == "warming":
+            return {"status": "starting", "phases": phases}
+        if _readiness["data"] == "failed":
+            return {"status": "error", "phases": phases, "detail": _readiness["error"]}
+        df = repository.load()
     latest = df["occurred_ts"].max()
     earliest = df["occurred_ts"].min()
     return {
         "status": "ok",
+        "phases": phases,
         "records": len(df),
         "earliest": earliest.isoformat() if earliest is not None else None,
         "latest": latest.isoformat() if latest is not None else None,
@@ -61,6 +150,10 @@ def healthcheck() -> Dict[str, str]:
 def compstat(
     group_by: Optional[str] = Query(None, description="Optional column to group results by.")
 ) -> Dict[str, object]:
+    if group_by is None:
+        return _aggregate_state().compstat()
+    if group_by == "crime_category":
+        return _aggregate_state().compstat(by_category=True)
     df = repository.load()
     return compute_compstat(df, group_by=group_by)
 
@@ -78,19 +171,11 @@ def timeseries(
 
 @app.get("/eda/distributions")
 def eda_distributions() -> Dict[str, object]:
-    df = repository.load()
-    hour_distribution = (
-        df.groupby("hour_of_day").size().reset_index(name="count").sort_values("hour_of_day")
-    )
-    day_distribution = (
-        df.groupby("day_of_week").size().reset_index(name="count").sort_values("count", ascending=False)
-    )
-    beats_distribution = (
-        df.groupby("Beats").size().reset_index(name="count").sort_values("count", ascending=False)
-    )
-    category_distribution = (
-        df.groupby("crime_category").size().reset_index(name="count").sort_values("count", ascending=False)
-    )
+    state = _aggregate_state()
+    hour_distribution = state.count_frame("hour_of_day").sort_values("hour_of_day")
+    day_distribution = state.count_frame("day_of_week").sort_values("count", ascending=False)
+    beats_distribution = state.count_frame("Beats").sort_values("count", ascending=False)
+    category_distribution = state.count_frame("crime_category").sort_values("count", ascending=False)
     return {
         "hour_of_day": hour_distribution.to_dict(orient="records"),
         "day_of_week": day_distribution.to_dict(orient="records"),
@@ -131,7 +216,7 @@ def aggregates_heatmap(
 
 @app.get("/ml/random-forest")
 def random_forest_forecast() -> Dict[str, object]:
-    result = _train_if_stale("random_forest", train_random_forest)
+    result = _train_if_stale("random_forest", _modeling().train_random_forest)
     return {
         "metrics": result.metrics,
         "next_week_forecast": result.next_week,
@@ -140,7 +225,7 @@ def random_forest_forecast() -> Dict[str, object]:
 
 @app.get("/ml/sarimax")
 def sarimax_forecast() -> Dict[str, object]:
-    result = _train_if_stale("sarimax", train_sarimax)
+    result = _train_if_stale("sarimax", _modeling().train_sarimax)
     summary_lines = result.model_summary.splitlines()
     trimmed_summary = "\n".join(summary_lines[:20])
     return {
@@ -152,6 +237,7 @@ def sarimax_forecast() -> Dict[str, object]:
 
 @app.post("/cache/refresh")
 def refresh_cache() -> Dict[str, str]:
+    # The reloaded frame is a new object, so the aggregate cache (keyed on it) invalidates itself.
     repository.refresh()
     for cache in _model_cache.values():
         cache["latest_ts"] = None
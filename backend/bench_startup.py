@@ -0,0 +1,85 @@
+"""Cold-start benchmark for the API.
+
+Each sample runs in a fresh interpreter so import costs are not shared between runs.
+The ``baseline`` mode reproduces the cold start before lazy startup existed: the
+ML stack is imported together with the app and no warm-up runs, so the first
+request parses the CSV.
+
+    python backend/bench_startup.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+_PROBE = """
+import contextlib, json, os, sys, time
+baseline = os.environ["BENCH_MODE"] == "baseline"
+t0 = time.perf_counter()
+if baseline:
+    import backend.app.modeling
+from backend.app import main
+t_import = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(main.app)
+with contextlib.nullcontext(client) if baseline else client:
+    t_started = time.perf_counter()
+    ml_at_startup = "sklearn" in sys.modules or "statsmodels" in sys.modules
+    client.get("/health")
+    t_health = time.perf_counter()
+    client.get("/compstat")
+    t_data = time.perf_counter()
+print(json.dumps({
+    "import_s": t_import - t0,
+    "startup_s": t_started - t0,
+    "first_health_s": t_health - t0,
+    "first_compstat_s": t_data - t0,
+    "ml_loaded_at_startup": ml_at_startup,
+}))
+"""
+
+METRICS = ("import_s", "startup_s", "first_health_s", "first_compstat_s")
+MODES = ("baseline", "eager", "lazy")
+
+
+def _sample(mode: str) -> Dict[str, object]:
+    env = dict(
+        os.environ,
+        BENCH_MODE=mode,
+        STARTUP_MODE="lazy" if mode == "baseline" else mode,
+        PYTHONPATH=str(PROJECT_ROOT),
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=PROJECT_ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure API import and startup latency per startup mode.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+
+    print(f"{'mode':<8} " + " ".join(f"{metric:>17}" for metric in METRICS) + "  ml@startup")
+    for mode in args.modes:
+        samples: List[Dict[str, object]] = [_sample(mode) for _ in range(args.runs)]
+        medians = [statistics.median(float(sample[metric]) for sample in samples) for metric in METRICS]
+        print(
+            f"{mode:<8} "
+            + " ".join(f"{value:>17.3f}" for value in medians)
+            + f"  {samples[0]['ml_loaded_at_startup']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -431,7 +431,6 @@ async function loadDashboard() {
     try {
         setApiStatus(`Loading analytics from ${API_BASE}...`);
         const requiredEndpoints = [
-            ["health", "/health"],
             ["compstat", "/compstat"],
             ["series", "/timeseries?freq=D&periods=90"],
             ["distributions", "/eda/distributions"],
@@ -448,6 +447,8 @@ async function loadDashboard() {
         requiredEndpoints.forEach(([label], index) => {
             requiredData[label] = requiredResults[index].value;
         });
+        // /health does not wait for the startup warm-up, so ask once the data endpoints have answered.
+        requiredData.health = await fetchJSON("/health");
 
         const optionalEndpoints = {
             forecast: "/ml/random-forest",
@@ -496,8 +497,11 @@ async function loadDashboard() {
         }
 
         const health = requiredData.health;
-        document.getElementById("totalIncidents").textContent = health.records.toLocaleString();
-        document.getElementById("coverageRange").textContent = `${health.earliest?.split("T")[0]} - ${health.latest?.split("T")[0]}`;
+        document.getElementById("totalIncidents").textContent = health.records?.toLocaleString() ?? "--";
+        document.getElementById("coverageRange").textContent =
+            health.earliest && health.latest
+                ? `${health.earliest.split("T")[0]} - ${health.latest.split("T")[0]}`
+                : "--";
 
         renderLineChart(requiredData.series);
         renderCategoryChart(requiredData.distributions.crime_category.slice(0, 5));
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+from typing import List
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+DATA_FILE = PROJECT_ROOT / "data" / "East District Arlingtontx odp crime - PROD.csv"
+
+
+@pytest.fixture(scope="session")
+def csv_lines() -> List[str]:
+    """Header plus raw rows of the bundled dataset, newline-terminated."""
+    return DATA_FILE.read_text().splitlines(keepends=True)
+
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import io
+
+import pandas as pd
+import pytest
+
+from backend.app.aggregations import AggregateState
+from backend.app.analytics import compute_compstat
+from backend.app.data_loader import _preprocess
+
+
+@pytest.fixture(scope="module")
+def frame(csv_lines) -> pd.DataFrame:
+    return _preprocess(pd.read_csv(io.StringIO("".join(csv_lines[:801]))))
+
+
+def test_round_trip_preserves_state(frame):
+    state = AggregateState.from_frame(frame)
+    restored = AggregateState.from_dict(state.as_dict())
+
+    assert restored.as_dict() == state.as_dict()
+    assert restored.compstat(by_category=True) == state.compstat(by_category=True)
+    pd.testing.assert_frame_equal(restored.count_frame("Beats"), state.count_frame("Beats"))
+    pd.testing.assert_frame_equal(restored.daily_series(periods=30), state.daily_series(periods=30))
+
+
+def test_merged_halves_match_single_pass(frame):
+    merged = AggregateState.from_frame(frame.iloc[:400]).merge(AggregateState.from_frame(frame.iloc[400:]))
+    assert merged.as_dict() == AggregateState.from_frame(frame).as_dict()
+
+
+def test_compstat_matches_frame_based_compstat(frame):
+    state = AggregateState.from_frame(frame)
+    assert state.compstat() == compute_compstat(frame)
+    assert state.compstat(by_category=True) == compute_compstat(frame, group_by="crime_category")
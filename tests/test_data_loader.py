@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+
+from backend.app.data_loader import CsvWatermark, read_csv_increment
+
+BEATS_INDEX = 4
+
+
+def _set_beat(line: str, value: str) -> str:
+    fields = line.rstrip("\n").split(",")
+    fields[BEATS_INDEX] = value
+    return ",".join(fields) + "\n"
+
+
+def _plain_rows(csv_lines, start, count):
+    return [line for line in csv_lines[start:] if '"' not in line][:count]
+
+
+def _write(path, lines) -> None:
+    path.write_text("".join(lines))
+
+
+def _append(path, lines) -> None:
+    with open(path, "a") as handle:
+        handle.write("".join(lines))
+
+
+def test_first_read_is_full(tmp_path, csv_lines):
+    path = tmp_path / "data.csv"
+    _write(path, csv_lines[:101])
+
+    rows, watermark, rebuilt = read_csv_increment(str(path))
+
+    assert rebuilt
+    assert len(rows) == 100
+    assert watermark.offset == path.stat().st_size
+    assert watermark.dtypes["Beats"] == "int64"
+
+
+def test_unchanged_file_short_circuits(tmp_path, csv_lines):
+    path = tmp_path / "data.csv"
+    _write(path, csv_lines[:101])
+    _, watermark, _ = read_csv_increment(str(path))
+
+    rows, again, rebuilt = read_csv_increment(str(path), watermark)
+
+    assert rows.empty
+    assert not rebuilt
+    assert again == watermark
+
+
+def test_append_reads_only_new_rows(tmp_path, csv_lines):
+    path = tmp_path / "data.csv"
+    _write(path, csv_lines[:101])
+    _, watermark, _ = read_csv_increment(str(path))
+    _append(path, csv_lines[101:151])
+
+    rows, updated, rebuilt = read_csv_increment(str(path), watermark)
+
+    assert not rebuilt
+    assert len(rows) == 50
+    assert set(rows["Case Number"]) == {line.split(",")[0] for line in csv_lines[101:151]}
+    assert updated.offset == path.stat().st_size
+    assert updated.dtypes == watermark.dtypes
+
+
+def test_in_place_edit_rebuilds(tmp_path, csv_lines):
+    path = tmp_path / "data.csv"
+    _write(path, csv_lines[:101])
+    _, watermark, _ = read_csv_increment(str(path))
+    edited = list(csv_lines[:101])
+    edited[1] = _set_beat(edited[1], "999")
+    _write(path, edited)
+    os.utime(path, (watermark.mtime + 10, watermark.mtime + 10))
+
+    rows, _, rebuilt = read_csv_increment(str(path), watermark)
+
+    assert rebuilt
+    assert len(rows) == 100
+
+
+def test_truncation_rebuilds(tmp_path, csv_lines):
+    path = tmp_path / "data.csv"
+    _write(path, csv_lines[:101])
+    _, watermark, _ = read_csv_increment(str(path))
+    _write(path, csv_lines[:51])
+
+    rows, _, rebuilt = read_csv_increment(str(path), watermark)
+
+    assert rebuilt
+    assert len(rows) == 50
+
+
+def test_missing_trailing_newline_rebuilds_on_append(tmp_path, csv_lines):
+    path = tmp_path / "data.csv"
+    head = "".join(csv_lines[:101]).rstrip("\n")
+    path.write_text(head)
+    _, watermark, _ = read_csv_increment(str(path))
+    _append(path, ["\n"] + csv_lines[101:111])
+
+    rows, _, rebuilt = read_csv_increment(str(path), watermark)
+
+    assert rebuilt
+    assert len(rows) == 110
+
+
+def test_appended_rows_with_drifting_dtypes_rebuild(tmp_path, csv_lines):
+    for beat in ("", "UNK"):
+        path = tmp_path / f"data_{beat or 'blank'}.csv"
+        _write(path, csv_lines[:101])
+        _, watermark, _ = read_csv_increment(str(path))
+        extra = _plain_rows(csv_lines, 101, 5)
+        extra[0] = _set_beat(extra[0], beat)
+        _append(path, extra)
+
+        rows, updated, rebuilt = read_csv_increment(str(path), watermark)
+
+        assert rebuilt
+        assert len(rows) == 105
+        assert updated.dtypes["Beats"] != "int64"
+
+
+def test_watermark_round_trip():
+    watermark = CsvWatermark(offset=10, mtime=1.5, sha256="abc", dtypes={"Beats": "int64"})
+    assert CsvWatermark.from_dict(watermark.as_dict()) == watermark
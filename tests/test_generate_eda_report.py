@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from analysis.generate_eda_report import _partition_dirs, generate
+
+BEATS_INDEX = 4
+
+
+def _set_beat(line: str, value: str) -> str:
+    fields = line.rstrip("\n").split(",")
+    fields[BEATS_INDEX] = value
+    return ",".join(fields) + "\n"
+
+
+def _outputs(root: Path) -> Dict[str, str]:
+    return {
+        str(path.relative_to(root)): path.read_text()
+        for path in sorted(root.rglob("*"))
+        if path.is_file() and path.name != "eda_state.json"
+    }
+
+
+def _incremental_and_full(tmp_path: Path, head: List[str], tail: List[str], group_by=None):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("".join(head))
+    generate(csv_path=str(csv_path), output_dir=tmp_path / "incremental", group_by=group_by)
+    with open(csv_path, "a") as handle:
+        handle.write("".join(tail))
+    generate(csv_path=str(csv_path), output_dir=tmp_path / "incremental", group_by=group_by)
+    generate(csv_path=str(csv_path), output_dir=tmp_path / "full", group_by=group_by, full=True)
+    return _outputs(tmp_path / "incremental"), _outputs(tmp_path / "full")
+
+
+@pytest.mark.parametrize("group_by", [None, "Beats"])
+def test_incremental_matches_full(tmp_path, csv_lines, group_by):
+    incremental, full = _incremental_and_full(tmp_path, csv_lines[:1501], csv_lines[1501:], group_by)
+    assert incremental
+    assert incremental == full
+
+
+@pytest.mark.parametrize("beat", ["", "UNK"])
+@pytest.mark.parametrize("group_by", [None, "Beats"])
+def test_appended_rows_with_different_dtypes_match_full(tmp_path, csv_lines, beat, group_by):
+    tail = [line for line in csv_lines[1501:] if '"' not in line][:50]
+    tail[0] = _set_beat(tail[0], beat)
+
+    incremental, full = _incremental_and_full(tmp_path, csv_lines[:1501], tail, group_by)
+
+    assert incremental == full
+    # A third run over unchanged data must keep working from the saved state.
+    generate(csv_path=str(tmp_path / "data.csv"), output_dir=tmp_path / "incremental", group_by=group_by)
+    assert _outputs(tmp_path / "incremental") == full
+
+
+def test_rebuild_removes_partitions_that_no_longer_exist(tmp_path, csv_lines):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("".join(csv_lines[:501]))
+    generate(csv_path=str(csv_path), output_dir=tmp_path, group_by="Beats")
+    assert len([path for path in (tmp_path / "Beats").iterdir() if path.is_dir()]) > 1
+
+    csv_path.write_text("".join([csv_lines[0]] + [line for line in csv_lines[1:501] if ",410," in line]))
+    generate(csv_path=str(csv_path), output_dir=tmp_path, group_by="Beats")
+
+    assert sorted(path.name for path in (tmp_path / "Beats").iterdir()) == ["410", "eda_state.json"]
+
+
+def test_partition_dirs_disambiguate_colliding_slugs(tmp_path):
+    dirs = _partition_dirs(tmp_path, "group", ["A/B", "A_B", "C"])
+
+    assert len(set(dirs.values())) == 3
+    assert dirs["C"] == tmp_path / "group" / "C"
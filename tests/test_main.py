@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from fastapi.testclient import TestClient
+import pytest
+
+from backend.app import main
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_refresh_during_requests_never_yields_missing_state():
+    client = TestClient(main.app)
+
+    def hit(index: int) -> int:
+        if index % 4 == 0:
+            return client.post("/cache/refresh").status_code
+        return client.get("/eda/distributions").status_code
+
+    with ThreadPoolExecutor(8) as executor:
+        statuses = list(executor.map(hit, range(40)))
+
+    assert set(statuses) == {200}
+    assert main._aggregate_cache["frame"] is main.repository.load()
+
+
+def test_unknown_startup_mode_fails_api_startup(monkeypatch):
+    monkeypatch.setattr(main.settings, "STARTUP_MODE", "eagre")
+    with pytest.raises(ValueError, match="STARTUP_MODE"):
+        with TestClient(main.app):
+            pass
+
+
+def test_unknown_startup_mode_does_not_break_settings_import():
+    env = dict(os.environ, STARTUP_MODE="eagre", PYTHONPATH=str(PROJECT_ROOT))
+    result = subprocess.run(
+        [sys.executable, "-c", "from backend.app.config import settings; print(settings.STARTUP_MODE)"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "eagre"